@@ -43,9 +43,7 @@ def download(
     results = downloader.download_multiple_songs(songs)
 
     if archive:
-        for result in results:
-            if result[1]:
-                url_archive.add(result[0].url)
+        url_archive.update(song.url for song, path in results if path)
 
         url_archive.save(archive)
 
@@ -60,7 +58,8 @@ def download(
             False,
         )
 
-    if save_path:
+    # The downloader already saved the songs if it uses the same save file
+    if save_path and str(save_path) != downloader.save_file:
         # Save the songs to a file
         with open(save_path, "w", encoding="utf-8") as save_file:
             json.dump(
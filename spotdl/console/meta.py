@@ -2,6 +2,8 @@
 Sync Lyrics module for the console
 """
 
+import os
+
 from pathlib import Path
 from typing import List
 
@@ -34,10 +36,18 @@ def meta(query: List[str], downloader: Downloader, **_) -> None:
             continue
 
         if test_path.is_dir():
-            for out_format in FFMPEG_FORMATS:
-                paths.extend(test_path.glob(f"*.{out_format}"))
+            # Scan the directory once instead of once per audio format,
+            # scandir entries already know if they are files.
+            # Extensions are compared case-insensitively, like glob on Windows
+            with os.scandir(test_path) as entries:
+                paths.extend(
+                    Path(entry.path)
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1][1:].lower() in FFMPEG_FORMATS
+                    and entry.is_file()
+                )
         elif test_path.is_file():
-            if test_path.suffix.split(".")[-1] not in FFMPEG_FORMATS:
+            if test_path.suffix.split(".")[-1].lower() not in FFMPEG_FORMATS:
                 downloader.progress_handler.error(
                     "File is not a supported audio format: " + path
                 )
@@ -103,7 +113,7 @@ def meta(query: List[str], downloader: Downloader, **_) -> None:
                 )
 
         # Apply metadata to the song
-        embed_metadata(file, song, file.suffix.split(".")[-1])
+        embed_metadata(file, song, file.suffix.split(".")[-1].lower())
 
         downloader.progress_handler.log(f"Applied metadata to {file.name}")
 
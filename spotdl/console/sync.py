@@ -2,6 +2,7 @@
 Sync module for the console.
 """
 
+import os
 import json
 
 from pathlib import Path
@@ -106,14 +107,11 @@ def sync(
         to_delete = set(old_files) - set(new_files)
 
         # Get all files that are new and have to be downloaded
+        # reuse the file names computed above instead of creating them again
         to_download = []
-        for song in new_songs:
-            song_path = create_file_name(
-                song, downloader.output, downloader.output_format
-            )
-
+        for song, song_path in zip(new_songs, new_files):
             # Skip the songs that are already downloaded
-            if Path(song_path).exists():
+            if song_path.exists():
                 # Add the song to the to_download list
                 # if overwrite is set to force
                 if downloader.overwrite == "force":
@@ -129,10 +127,10 @@ def sync(
 
         # Delete all files that are no longer in the song lists
         for file in to_delete:
-            if file.exists():
-                file.unlink()
+            try:
+                os.unlink(file)
                 downloader.progress_handler.log(f"Removed {file}")
-            else:
+            except FileNotFoundError:
                 downloader.progress_handler.debug(f"{file} does not exist.")
 
         # Create m3u file
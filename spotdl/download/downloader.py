@@ -5,13 +5,19 @@ Downloader module, this is where all the downloading pre/post processing happens
 import json
 import datetime
 import asyncio
+import functools
+import os
+import queue
 import shutil
 import sys
+import tempfile
 import concurrent.futures
+import contextvars
+import textwrap
 import traceback
 
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from yt_dlp.postprocessor.sponsorblock import SponsorBlockPP
 from yt_dlp.postprocessor.modify_chapters import ModifyChaptersPP
@@ -24,11 +30,23 @@ from spotdl.providers.audio.base import AudioProvider
 from spotdl.providers.lyrics import Genius, MusixMatch, AzLyrics
 from spotdl.providers.lyrics.base import LyricsProvider
 from spotdl.providers.audio import YouTube, YouTubeMusic
-from spotdl.download.progress_handler import NAME_TO_LEVEL, ProgressHandler
+from spotdl.download.progress_handler import (
+    NAME_TO_LEVEL,
+    ProgressHandler,
+    SongTracker,
+)
 from spotdl.utils.config import get_errors_path, get_temp_path
 from spotdl.utils.search import reinit_song
 
 
+T = TypeVar("T")
+
+# Progress tracker of the song that is downloaded in the current context,
+# used to route yt-dlp progress from the shared audio providers to the right song
+PROGRESS_TRACKER: "contextvars.ContextVar[Optional[SongTracker]]" = (
+    contextvars.ContextVar("progress_tracker", default=None)
+)
+
 AUDIO_PROVIDERS: Dict[str, Type[AudioProvider]] = {
     "youtube": YouTube,
     "youtube-music": YouTubeMusic,
@@ -160,9 +178,19 @@ class Downloader:
         # semaphore is required to limit concurrent asyncio executions
         self.semaphore = asyncio.Semaphore(threads)
 
-        # thread pool executor is used to run blocking (CPU-bound) code from a thread
+        # conversions have their own semaphore, so that songs can be searched for
+        # while the previous ones are still being converted
+        ffmpeg_workers = min(threads, os.cpu_count() or 1)
+        self.ffmpeg_semaphore = asyncio.Semaphore(ffmpeg_workers)
+
+        # number of songs that can be processed at the same time
+        # (searched for or converted)
+        self.workers = threads + ffmpeg_workers
+
+        # thread pool executor is used to run blocking code (providers, yt-dlp,
+        # ffmpeg, mutagen) from a thread, everything else runs on the event loop
         self.thread_executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=threads
+            max_workers=self.workers
         )
 
         # If ffmpeg is the default value and it's not installed
@@ -190,6 +218,9 @@ class Downloader:
         self.errors: List[str] = []
         self.sponsor_block = sponsor_block
         self.audio_providers_classes = audio_providers_classes
+
+        # audio providers are reused between songs, see checkout_audio_providers
+        self.audio_providers: "queue.Queue[List[AudioProvider]]" = queue.Queue()
         self.progress_handler = ProgressHandler(NAME_TO_LEVEL[log_level], simple_tui)
         self.playlist_numbering = playlist_numbering
         self.preserve_original_audio = preserve_original_audio
@@ -198,6 +229,11 @@ class Downloader:
         for lyrics_provider_class in lyrics_providers_classes:
             self.lyrics_providers.append(lyrics_provider_class())
 
+        # the providers don't change, so their names are only joined once
+        self.lyrics_provider_names = ", ".join(
+            lyrics_provider.name for lyrics_provider in self.lyrics_providers
+        )
+
         self.progress_handler.debug("Downloader initialized")
 
     def download_song(self, song: Song) -> Tuple[Song, Optional[Path]]:
@@ -221,7 +257,7 @@ class Downloader:
         self, songs: List[Song]
     ) -> List[Tuple[Song, Optional[Path]]]:
         """
-        Download multiple songs to the temp directory.
+        Download multiple songs to the output directory.
 
         ### Arguments
         - songs: The songs to download.
@@ -232,18 +268,27 @@ class Downloader:
 
         self.progress_handler.set_song_count(len(songs))
 
-        tasks = [self.pool_download(song) for song in songs]
-
-        # call all task asynchronously, and wait until all are finished
-        results = list(self.loop.run_until_complete(self.aggregate_tasks(tasks)))
+        # download all songs asynchronously, and wait until all are finished
+        results = self.loop.run_until_complete(self.pool_download_multiple(songs))
 
         if self.print_errors:
             for error in self.errors:
                 self.progress_handler.error(error)
 
         if self.save_file:
+            # Write the songs one by one instead of building a list with all of them,
+            # the output is the same as json.dump(..., indent=4)
             with open(self.save_file, "w", encoding="utf-8") as save_file:
-                json.dump([song.json for song, _ in results], save_file, indent=4)
+                save_file.write("[")
+                for index, (song, _) in enumerate(results):
+                    save_file.write(",\n" if index else "\n")
+                    save_file.write(
+                        textwrap.indent(
+                            json.dumps(song.json, indent=4, ensure_ascii=False), "    "
+                        )
+                    )
+
+                save_file.write("\n]" if results else "]")
 
         return results
 
@@ -258,41 +303,111 @@ class Downloader:
         - tuple with the song and the path to the downloaded file if successful.
 
         ### Notes
-        - This method calls `self.search_and_download` in a new thread.
+        - Only `threads` songs are searched for at the same time,
+            and at most one song per cpu core is converted at the same time.
         """
 
-        # tasks that cannot acquire semaphore will wait here until it's free
-        # only certain amount of tasks can acquire the semaphore at the same time
-        async with self.semaphore:
-            # The following function calls blocking code, which would block whole event loop.
-            # Therefore it has to be called in a separate thread via ThreadPoolExecutor. This
-            # is not a problem, since GIL is released for the I/O operations, so it shouldn't
-            # hurt performance.
-            return await self.loop.run_in_executor(
-                self.thread_executor, self.search_and_download, song
+        # tasks that cannot acquire the semaphores will wait
+        # in search_and_download until they are free
+        return await self.search_and_download(song)
+
+    def checkout_audio_providers(self) -> List[AudioProvider]:
+        """
+        Take a set of audio providers (one per provider class) from the pool,
+        new ones are created if all of them are in use.
+
+        ### Returns
+        - list of audio providers, in the same order as the provider classes.
+
+        ### Notes
+        - yt-dlp handlers are not thread safe, so a set of providers
+            can only be used by one song at a time.
+        - Has to be returned with `checkin_audio_providers` when no longer used.
+        """
+
+        try:
+            return self.audio_providers.get_nowait()
+        except queue.Empty:
+            pass
+
+        audio_providers = []
+        for audio_provider_class in self.audio_providers_classes:
+            audio_provider = audio_provider_class(
+                output_format=self.output_format,
+                cookie_file=self.cookie_file,
+                search_query=self.search_query,
+                filter_results=self.filter_results,
             )
 
-    def search(self, song: Song) -> Tuple[str, AudioProvider]:
+            # The hook is added once, since the providers are reused between songs
+            audio_provider.audio_handler.add_progress_hook(self.yt_dlp_progress_hook)
+            audio_providers.append(audio_provider)
+
+        return audio_providers
+
+    def checkin_audio_providers(self, audio_providers: List[AudioProvider]) -> None:
+        """
+        Return a set of audio providers to the pool, so they can be reused.
+
+        ### Arguments
+        - audio_providers: The audio providers from `checkout_audio_providers`.
+        """
+
+        self.audio_providers.put_nowait(audio_providers)
+
+    async def pool_download_multiple(
+        self, songs: List[Song]
+    ) -> List[Tuple[Song, Optional[Path]]]:
+        """
+        Download multiple songs using a fixed number of workers.
+
+        ### Arguments
+        - songs: The songs to download.
+
+        ### Returns
+        - list of tuples with the song and the path to the downloaded file if successful,
+            in the same order as the songs.
+
+        ### Notes
+        - Songs are handed out to the workers through a queue, instead of
+            creating a coroutine for every song that waits on the semaphores.
+        """
+
+        results: List[Tuple[Song, Optional[Path]]] = [(song, None) for song in songs]
+        songs_queue: "asyncio.Queue[Tuple[int, Song]]" = asyncio.Queue()
+        for index, song in enumerate(songs):
+            songs_queue.put_nowait((index, song))
+
+        async def worker() -> None:
+            while not songs_queue.empty():
+                index, song = songs_queue.get_nowait()
+                results[index] = await self.pool_download(song)
+
+        await asyncio.gather(*(worker() for _ in range(self.workers)))
+
+        return results
+
+    def search(
+        self, song: Song, audio_providers: Optional[List[AudioProvider]] = None
+    ) -> Tuple[str, AudioProvider]:
         """
         Search for a song using all available providers.
 
         ### Arguments
         - song: The song to search for.
+        - audio_providers: The audio providers to use, if not provided
+            a set is checked out from the pool for the duration of the search.
 
         ### Returns
         - tuple with download url and audio provider if successful.
         """
 
-        audio_providers: List[AudioProvider] = []
-        for audio_provider_class in self.audio_providers_classes:
-            audio_providers.append(
-                audio_provider_class(
-                    output_format=self.output_format,
-                    cookie_file=self.cookie_file,
-                    search_query=self.search_query,
-                    filter_results=self.filter_results,
-                )
-            )
+        if audio_providers is None:
+            audio_providers = self.checkout_audio_providers()
+            try:
+                return self.search(song, audio_providers)
+            finally:
+                self.checkin_audio_providers(audio_providers)
 
         for audio_provider in audio_providers:
             url = audio_provider.search(song)
@@ -331,7 +446,45 @@ class Downloader:
 
         return None
 
-    def search_and_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
+    async def run_blocking(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run blocking code in the thread pool executor without blocking the event loop.
+
+        ### Arguments
+        - func: The function to run.
+        - args: Positional arguments passed to the function.
+        - kwargs: Keyword arguments passed to the function.
+
+        ### Returns
+        - The return value of the function.
+        """
+
+        # run_in_executor doesn't copy the context, so the progress tracker
+        # of the song has to be passed to the thread explicitly
+        context = contextvars.copy_context()
+
+        return await self.loop.run_in_executor(
+            self.thread_executor,
+            context.run,
+            functools.partial(func, *args, **kwargs),
+        )
+
+    @staticmethod
+    def yt_dlp_progress_hook(data: Dict[str, Any]) -> None:
+        """
+        Forward the yt-dlp progress to the progress tracker of the current song.
+
+        ### Arguments
+        - data: The progress data from yt-dlp.
+        """
+
+        progress_tracker = PROGRESS_TRACKER.get()
+        if progress_tracker is not None:
+            progress_tracker.yt_dlp_progress_hook(data)
+
+    async def search_and_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         """
         Search for the song and download it.
 
@@ -342,234 +495,304 @@ class Downloader:
         - tuple with the song and the path to the downloaded file if successful.
 
         ### Notes
-        - This function is synchronous.
+        - Blocking calls (searching, yt-dlp, ffmpeg, metadata embedding)
+            are offloaded to the thread pool executor.
+        - The search semaphore is released before the conversion starts,
+            so the next song can be searched for while this one is converted.
         """
 
-        # Check if we have all the metadata
-        # and that the song object is not a placeholder
-        # If it's None extract the current metadata
-        # And reinitialize the song object
-        if song.name is None and song.url:
-            song = reinit_song(song, self.playlist_numbering)
-
-        # Find song lyrics and add them to the song object
-        lyrics = self.search_lyrics(song)
-        if lyrics is None:
-            self.progress_handler.debug(
-                f"No lyrics found for {song.display_name}, "
-                "lyrics providers: "
-                f"{', '.join([lprovider.name for lprovider in self.lyrics_providers])}"
-            )
-        else:
-            song.lyrics = lyrics
-
-        # Initalize the progress tracker
-        display_progress_tracker = self.progress_handler.get_new_tracker(song)
-
-        # Create the output file path
-        output_file = create_file_name(song, self.output, self.output_format)
-        temp_folder = get_temp_path()
-
-        # Restrict the filename if needed
-        if self.restrict is True:
-            output_file = restrict_filename(output_file)
-
-        # If the file already exists and we don't want to overwrite it,
-        # we can skip the download
-        if output_file.exists() and self.overwrite == "skip":
-            self.progress_handler.log(f"Skipping {song.display_name}")
-            display_progress_tracker.notify_download_skip()
-            return song, None
-
-        if output_file.exists() and self.overwrite == "metadata":
-            embed_metadata(
-                output_file=output_file, song=song, file_format=self.output_format
-            )
+        async with self.semaphore:
+            # Check if we have all the metadata
+            # and that the song object is not a placeholder
+            # If it's None extract the current metadata
+            # And reinitialize the song object
+            if song.name is None and song.url:
+                song = await self.run_blocking(
+                    reinit_song, song, self.playlist_numbering
+                )
 
-            self.progress_handler.log(f"Updated metadata for {song.display_name}")
-            display_progress_tracker.notify_complete()
+            # Find song lyrics and add them to the song object
+            lyrics = await self.run_blocking(self.search_lyrics, song)
+            if lyrics is None:
+                self.progress_handler.debug(
+                    f"No lyrics found for {song.display_name}, "
+                    f"lyrics providers: {self.lyrics_provider_names}"
+                )
+            else:
+                song.lyrics = lyrics
+
+            # Initalize the progress tracker
+            display_progress_tracker = self.progress_handler.get_new_tracker(song)
+            PROGRESS_TRACKER.set(display_progress_tracker)
+
+            # Create the output file path
+            output_file = create_file_name(song, self.output, self.output_format)
+
+            # Restrict the filename if needed
+            if self.restrict is True:
+                output_file = restrict_filename(output_file)
+
+            # Check only once if the file already exists,
+            # every overwrite mode depends on it
+            if output_file.exists():
+                # If we don't want to overwrite it, we can skip the download
+                if self.overwrite == "skip":
+                    self.progress_handler.log(f"Skipping {song.display_name}")
+                    display_progress_tracker.notify_download_skip()
+                    return song, None
+
+                if self.overwrite == "metadata":
+                    await self.run_blocking(
+                        embed_metadata,
+                        output_file=output_file,
+                        song=song,
+                        file_format=self.output_format,
+                    )
 
-            return song, output_file
+                    self.progress_handler.log(
+                        f"Updated metadata for {song.display_name}"
+                    )
+                    display_progress_tracker.notify_complete()
 
-        # Don't skip if the file exists and overwrite is set to force
-        if output_file.exists() and self.overwrite == "force":
-            self.progress_handler.debug(f"Overwriting {song.display_name}")
+                    return song, output_file
 
-        # Create the output directory if it doesn't exist
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+                # Don't skip if overwrite is set to force
+                if self.overwrite == "force":
+                    self.progress_handler.debug(f"Overwriting {song.display_name}")
 
-        try:
-            if song.download_url is None:
-                download_url, audio_provider = self.search(song)
-            else:
-                # If the song object already has a download url
-                # we can skip the search, and just reinitialize the base
-                # audio provider to download the song
-                download_url = song.download_url
-                audio_provider = AudioProvider(
-                    output_format=self.output_format,
-                    cookie_file=self.cookie_file,
-                    search_query=self.search_query,
-                    filter_results=self.filter_results,
-                )
+            # Create the output directory if it doesn't exist
+            output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            self.progress_handler.debug(
-                f"Downloading {song.display_name} using {download_url}, "
-                f"audio provider: {audio_provider.name}"
-            )
+            audio_providers: List[AudioProvider] = []
 
-            # Add progress hook to the audio provider
-            audio_provider.audio_handler.add_progress_hook(
-                display_progress_tracker.yt_dlp_progress_hook
-            )
-
-            # Download the song using yt-dlp
-            download_info = audio_provider.get_download_metadata(
-                download_url, download=True
-            )
+            try:
+                # Creating new providers can fail (e.g. with an invalid cookie file),
+                # so it has to be done inside the try block like the search
+                audio_providers = await self.run_blocking(self.checkout_audio_providers)
 
-            temp_file = Path(
-                temp_folder / f"{download_info['id']}.{download_info['ext']}"
-            )
+                if song.download_url is None:
+                    download_url, audio_provider = await self.run_blocking(
+                        self.search, song, audio_providers
+                    )
+                else:
+                    # If the song object already has a download url
+                    # we can skip the search, and just use the first
+                    # audio provider to download the song
+                    download_url = song.download_url
+                    audio_provider = audio_providers[0]
 
-            if download_info is None:
                 self.progress_handler.debug(
-                    f"No download info found for {song.display_name}, url: {download_url}"
+                    f"Downloading {song.display_name} using {download_url}, "
+                    f"audio provider: {audio_provider.name}"
                 )
 
-                raise LookupError(
-                    f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
+                # Download the song to the temp folder using yt-dlp
+                download_info = await self.run_blocking(
+                    audio_provider.get_download_metadata, download_url, download=True
                 )
 
-            display_progress_tracker.notify_download_complete()
+                if download_info is None:
+                    self.progress_handler.debug(
+                        f"No download info found for {song.display_name}, "
+                        f"url: {download_url}"
+                    )
 
-            bitrate: Optional[str] = (
-                self.bitrate if self.bitrate else f"{int(download_info['abr'])}k"
-            )
+                    raise LookupError(
+                        f"yt-dlp failed to get metadata for: {song.name} - {song.artist}"
+                    )
 
-            # Ignore the bitrate if the preserve original audio
-            # option is set to true
-            if self.preserve_original_audio:
-                bitrate = None
+                temp_file = Path(
+                    get_temp_path() / f"{download_info['id']}.{download_info['ext']}"
+                )
+            except (Exception, UnicodeEncodeError) as exception:
+                return self.handle_download_error(
+                    song, display_progress_tracker, exception
+                )
+            finally:
+                # Only return the providers if they were checked out
+                if audio_providers:
+                    self.checkin_audio_providers(audio_providers)
 
-            success, result = convert(
-                input_file=temp_file,
-                output_file=output_file,
-                ffmpeg=self.ffmpeg,
-                output_format=self.output_format,
-                bitrate=bitrate,
-                ffmpeg_args=self.ffmpeg_args,
-                progress_handler=display_progress_tracker.ffmpeg_progress_hook,
-            )
+        async with self.ffmpeg_semaphore:
+            display_progress_tracker.notify_download_complete()
 
-            # Remove the temp file
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except (PermissionError, OSError) as exc:
-                    self.progress_handler.debug(
-                        f"Could not remove temp file: {temp_file}, error: {exc}"
-                    )
+            part_file: Optional[Path] = None
 
-                    raise DownloaderError(
-                        f"Could not remove temp file: {temp_file}, possible duplicate song"
-                    ) from exc
-
-            if not success and result:
-                # If the conversion failed and there is an error message
-                # create a file with the error message
-                # and save it in the errors directory
-                # raise an exception with file path
-                file_name = (
-                    get_errors_path()
-                    / f"ffmpeg_error_{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.txt"
+            try:
+                bitrate: Optional[str] = (
+                    self.bitrate if self.bitrate else f"{int(download_info['abr'])}k"
                 )
 
-                error_message = ""
-                for key, value in result.items():
-                    error_message += f"### {key}:\n{str(value).strip()}\n\n"
+                # Ignore the bitrate if the preserve original audio
+                # option is set to true
+                if self.preserve_original_audio:
+                    bitrate = None
+
+                # Convert to a temporary file next to the output file first,
+                # so that a failed or interrupted conversion never leaves
+                # a broken file (or removes an existing one) at the output path.
+                # A short name is used, because the output file name
+                # can already be as long as the file system allows
+                part_fd, part_path = tempfile.mkstemp(
+                    suffix=".part", dir=output_file.parent
+                )
+                os.close(part_fd)
+                part_file = Path(part_path)
+
+                success, result = await self.run_blocking(
+                    convert,
+                    input_file=temp_file,
+                    output_file=part_file,
+                    ffmpeg=self.ffmpeg,
+                    output_format=self.output_format,
+                    bitrate=bitrate,
+                    ffmpeg_args=self.ffmpeg_args,
+                    progress_handler=display_progress_tracker.ffmpeg_progress_hook,
+                )
 
-                with open(file_name, "w", encoding="utf-8") as error_path:
-                    error_path.write(error_message)
+                if not success and result:
+                    # If the conversion failed and there is an error message
+                    # create a file with the error message
+                    # and save it in the errors directory
+                    # raise an exception with file path
+                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+                    file_name = get_errors_path() / f"ffmpeg_error_{timestamp}.txt"
 
-                # Remove the file that failed to convert
-                if output_file.exists():
-                    output_file.unlink()
+                    error_message = ""
+                    for key, value in result.items():
+                        error_message += f"### {key}:\n{str(value).strip()}\n\n"
 
-                raise FFmpegError(
-                    f"Failed to convert {song.display_name}, "
-                    f"you can find error here: {str(file_name.absolute())}"
-                )
+                    with open(file_name, "w", encoding="utf-8") as error_path:
+                        error_path.write(error_message)
 
-            download_info["filepath"] = str(output_file)
+                    raise FFmpegError(
+                        f"Failed to convert {song.display_name}, "
+                        f"you can find error here: {str(file_name.absolute())}"
+                    )
 
-            # Set the song's download url
-            if song.download_url is None:
-                song.download_url = download_url
+                # Atomically move the converted file to the output path
+                os.replace(part_file, output_file)
 
-            display_progress_tracker.notify_conversion_complete()
+                download_info["filepath"] = str(output_file)
 
-            # SponsorBlock post processor
-            if self.sponsor_block:
-                # Initialize the sponsorblock post processor
-                post_processor = SponsorBlockPP(
-                    audio_provider.audio_handler, SPONSOR_BLOCK_CATEGORIES
-                )
+                # Set the song's download url
+                if song.download_url is None:
+                    song.download_url = download_url
 
-                # Run the post processor to get the sponsor segments
-                _, download_info = post_processor.run(download_info)
-                chapters = download_info["sponsorblock_chapters"]
+                display_progress_tracker.notify_conversion_complete()
 
-                # If there are sponsor segments, remove them
-                if len(chapters) > 0:
-                    self.progress_handler.log(
-                        f"Removing {len(chapters)} sponsor segments for {song.display_name}"
+                # Remove the sponsor segments using the sponsorblock post processor
+                if self.sponsor_block:
+                    await self.run_blocking(
+                        self.remove_sponsor_segments, song, download_info
                     )
 
-                    # Initialize the modify chapters post processor
-                    modify_chapters = ModifyChaptersPP(
-                        audio_provider.audio_handler,
-                        remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES,
+                try:
+                    await self.run_blocking(
+                        embed_metadata, output_file, song, self.output_format
                     )
+                except Exception as exception:
+                    raise MetadataError(
+                        "Failed to embed metadata to the song"
+                    ) from exception
 
-                    # Run the post processor to remove the sponsor segments
-                    # this returns a list of files to delete
-                    files_to_delete, download_info = modify_chapters.run(download_info)
+                display_progress_tracker.notify_complete()
 
-                    # Delete the files that were created by the post processor
-                    for file_to_delete in files_to_delete:
-                        Path(file_to_delete).unlink()
+                self.progress_handler.log(
+                    f'Downloaded "{song.display_name}": {song.download_url}'
+                )
 
-            try:
-                embed_metadata(output_file, song, self.output_format)
-            except Exception as exception:
-                raise MetadataError(
-                    "Failed to embed metadata to the song"
-                ) from exception
+                return song, output_file
+            except (Exception, UnicodeEncodeError) as exception:
+                return self.handle_download_error(
+                    song, display_progress_tracker, exception
+                )
+            finally:
+                # Remove the song downloaded by yt-dlp, and the converted file
+                # if it wasn't moved to the output path
+                for file_to_remove in (temp_file, part_file):
+                    if file_to_remove is None:
+                        continue
+
+                    try:
+                        os.unlink(file_to_remove)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as exc:
+                        self.progress_handler.debug(
+                            f"Could not remove temp file: {file_to_remove}, error: {exc}"
+                        )
+
+    def remove_sponsor_segments(self, song: Song, download_info: Dict) -> None:
+        """
+        Remove the sponsor segments from a converted song.
 
-            display_progress_tracker.notify_complete()
+        ### Arguments
+        - song: The song to remove the sponsor segments from.
+        - download_info: The yt-dlp metadata of the song, with the `filepath`
+            set to the converted file.
+        """
 
-            self.progress_handler.log(
-                f'Downloaded "{song.display_name}": {song.download_url}'
-            )
+        audio_providers = self.checkout_audio_providers()
+        audio_handler = audio_providers[0].audio_handler
 
-            return song, output_file
-        except (Exception, UnicodeEncodeError) as exception:
-            if isinstance(exception, UnicodeEncodeError):
-                exception_cause = exception
-                exception = DownloaderError(
-                    "You may need to add PYTHONIOENCODING=utf-8 to your environment"
+        try:
+            # Initialize the sponsorblock post processor
+            post_processor = SponsorBlockPP(audio_handler, SPONSOR_BLOCK_CATEGORIES)
+
+            # Run the post processor to get the sponsor segments
+            _, download_info = post_processor.run(download_info)
+            chapters = download_info["sponsorblock_chapters"]
+
+            # If there are sponsor segments, remove them
+            if len(chapters) > 0:
+                self.progress_handler.log(
+                    f"Removing {len(chapters)} sponsor segments for {song.display_name}"
                 )
 
-                exception.__cause__ = exception_cause
+                # Initialize the modify chapters post processor
+                modify_chapters = ModifyChaptersPP(
+                    audio_handler, remove_sponsor_segments=SPONSOR_BLOCK_CATEGORIES
+                )
 
-            display_progress_tracker.notify_error(
-                traceback.format_exc(), exception, True
-            )
-            self.errors.append(
-                f"{song.url} - {exception.__class__.__name__}: {exception}"
+                # Run the post processor to remove the sponsor segments
+                # this returns a list of files to delete
+                files_to_delete, download_info = modify_chapters.run(download_info)
+
+                # Delete the files that were created by the post processor
+                for file_to_delete in files_to_delete:
+                    Path(file_to_delete).unlink()
+        finally:
+            self.checkin_audio_providers(audio_providers)
+
+    def handle_download_error(
+        self, song: Song, progress_tracker: SongTracker, exception: Exception
+    ) -> Tuple[Song, None]:
+        """
+        Report an exception raised while downloading a song.
+        Has to be called from within the `except` block.
+
+        ### Arguments
+        - song: The song that failed to download.
+        - progress_tracker: The progress tracker of the song.
+        - exception: The exception that was raised.
+
+        ### Returns
+        - tuple with the song and None as the path.
+        """
+
+        if isinstance(exception, UnicodeEncodeError):
+            exception_cause = exception
+            exception = DownloaderError(
+                "You may need to add PYTHONIOENCODING=utf-8 to your environment"
             )
-            return song, None
+
+            exception.__cause__ = exception_cause
+
+        progress_tracker.notify_error(traceback.format_exc(), exception, True)
+        self.errors.append(f"{song.url} - {exception.__class__.__name__}: {exception}")
+
+        return song, None
 
     @staticmethod
     async def aggregate_tasks(tasks):
@@ -3,6 +3,7 @@ Module that holds the ProgressHandler class and Song Tracker class.
 """
 
 import logging
+import threading
 
 from typing import Any, Callable, Dict, Optional, List
 
@@ -170,6 +171,10 @@ class ProgressHandler:
         self.update_callback = update_callback
         self.previous_overall = self.overall_completed_tasks
 
+        # song trackers are updated from the thread pool (e.g. ffmpeg progress),
+        # the lock makes sure that no update of the overall progress is lost
+        self.lock = threading.Lock()
+
         if log_level not in LEVEL_TO_NAME:
             raise ProgressHandlerError(f"Invalid log level: {log_level}")
 
@@ -418,44 +423,46 @@ class SongTracker:
         - message: The message to display.
         """
 
-        self.status = message
-
-        # The change in progress since last update
-        delta = self.progress - self.old_progress
+        with self.parent.lock:
+            self.status = message
 
-        if not self.parent.simple_tui:
-            # Update the progress bar
-            # `start_task` called everytime to ensure progress is remove from indeterminate state
-            self.parent.rich_progress_bar.start_task(self.task_id)
-            self.parent.rich_progress_bar.update(
-                self.task_id,
-                description=self.song.display_name,
-                message=message,
-                completed=self.progress,
-            )
+            # The change in progress since last update
+            delta = self.progress - self.old_progress
 
-            # If task is complete
-            if self.progress == 100 or message == "Error":
-                self.parent.overall_completed_tasks += 1
-                self.parent.rich_progress_bar.remove_task(self.task_id)
-        else:
-            # If task is complete
-            if self.progress == 100 or message == "Error":
-                self.parent.overall_completed_tasks += 1
-            if delta:
-                self.parent.log(f"{self.song.name} - {self.song.artist}: {message}")
-
-        # Update the overall progress bar
-        if self.parent.song_count == self.parent.overall_completed_tasks:
-            self.parent.overall_progress = self.parent.song_count * 100
-        else:
-            self.parent.overall_progress += delta
-
-        self.parent.update_overall()
-        self.old_progress = self.progress
+            if not self.parent.simple_tui:
+                # Update the progress bar
+                # `start_task` called everytime to ensure progress
+                # is remove from indeterminate state
+                self.parent.rich_progress_bar.start_task(self.task_id)
+                self.parent.rich_progress_bar.update(
+                    self.task_id,
+                    description=self.song.display_name,
+                    message=message,
+                    completed=self.progress,
+                )
 
-        if self.parent.update_callback:
-            self.parent.update_callback(self, message)
+                # If task is complete
+                if self.progress == 100 or message == "Error":
+                    self.parent.overall_completed_tasks += 1
+                    self.parent.rich_progress_bar.remove_task(self.task_id)
+            else:
+                # If task is complete
+                if self.progress == 100 or message == "Error":
+                    self.parent.overall_completed_tasks += 1
+                if delta:
+                    self.parent.log(f"{self.song.name} - {self.song.artist}: {message}")
+
+            # Update the overall progress bar
+            if self.parent.song_count == self.parent.overall_completed_tasks:
+                self.parent.overall_progress = self.parent.song_count * 100
+            else:
+                self.parent.overall_progress += delta
+
+            self.parent.update_overall()
+            self.old_progress = self.progress
+
+            if self.parent.update_callback:
+                self.parent.update_callback(self, message)
 
     def notify_error(
         self, message: str, traceback: Exception, finish: bool = False
@@ -30,12 +30,13 @@ class Artist(SongList):
     albums: List[Album]
 
     @classmethod
-    def from_url(cls, url: str) -> "Artist":
+    def from_url(cls, url: str, threads: int = 4) -> "Artist":
         """
         Creates an Artist object from a URL.
 
         ### Arguments
         - url: The URL of the artist.
+        - threads: The number of threads to fetch the songs with.
 
         ### Returns
         - The Artist object.
@@ -62,7 +63,7 @@ class Artist(SongList):
         # ignore duplicates
         urls = []
         for album_url in album_urls:
-            album = Album.from_url(album_url)
+            album = Album.from_url(album_url, threads)
             albums.append(album)
             for track in album.songs:
                 track_name = slugify(track.name)  # type: ignore
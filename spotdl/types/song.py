@@ -3,6 +3,7 @@ Song module that hold the Song and SongList classes.
 """
 
 import json
+import concurrent.futures
 
 from dataclasses import dataclass, asdict
 from typing import Dict, Any, List, Optional
@@ -153,12 +154,13 @@ class Song:
         )
 
     @classmethod
-    def list_from_search_term(cls, search_term: str) -> "List[Song]":
+    def list_from_search_term(cls, search_term: str, threads: int = 4) -> "List[Song]":
         """
         Creates a list of Song objects from a search term.
 
         ### Arguments
         - search_term: The search term to use.
+        - threads: The number of threads to fetch the songs with.
 
         ### Returns
         - The list of Song objects.
@@ -166,16 +168,14 @@ class Song:
 
         raw_search_results = Song.search(search_term)
 
-        songs = []
-        for idx, _ in enumerate(raw_search_results["tracks"]["items"]):
-            songs.append(
-                Song.from_url(
-                    "http://open.spotify.com/track/"
-                    + raw_search_results["tracks"]["items"][idx]["id"]
-                )
-            )
+        urls = [
+            "http://open.spotify.com/track/" + track["id"]
+            for track in raw_search_results["tracks"]["items"]
+        ]
 
-        return songs
+        # Fetch all songs concurrently, instead of one request after another
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(Song.from_url, urls))
 
     @classmethod
     def from_data_dump(cls, data: str) -> "Song":
@@ -307,12 +307,13 @@ class SongList:
         return cls(**metadata, urls=urls, songs=[])
 
     @classmethod
-    def from_url(cls, url: str):
+    def from_url(cls, url: str, threads: int = 4):
         """
         Parse an album from a Spotify URL.
 
         ### Arguments
         - url: The URL of the album.
+        - threads: The number of threads to fetch the songs with.
 
         ### Returns
         - The Album object.
@@ -324,7 +325,9 @@ class SongList:
 
         # Remove songs without id (country restricted/local tracks)
         # And create song object for each track
-        songs: List[Song] = [Song.from_url(url) for url in urls]
+        # The songs are fetched concurrently, instead of one request after another
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            songs: List[Song] = list(executor.map(Song.from_url, urls))
 
         return cls(
             **metadata,
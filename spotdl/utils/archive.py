@@ -2,8 +2,10 @@
 Module for archiving sets of data
 """
 
-from os.path import exists
-from typing import Set
+import os
+
+from os.path import abspath, exists
+from typing import Any, Optional, Set
 
 
 class Archive(Set):
@@ -12,6 +14,22 @@ class Archive(Set):
     A file-persistable set.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initializes the archive.
+
+        ### Arguments
+        - same as the builtin `set`
+        """
+
+        super().__init__(*args, **kwargs)
+
+        # Elements that are already in the file, and the number of lines in it,
+        # used to only append new elements on save
+        self.file: Optional[str] = None
+        self.saved: Set[str] = set()
+        self.file_lines = 0
+
     def load(self, file: str) -> bool:
         """
         Imports the archive from the file.
@@ -27,8 +45,14 @@ class Archive(Set):
             return False
 
         with open(file, "r", encoding="utf-8") as archive:
-            self.clear()
-            self.update([line.strip() for line in archive])
+            lines = [line.strip() for line in archive]
+
+        self.clear()
+        self.update(lines)
+
+        self.file = abspath(file)
+        self.saved = set(self)
+        self.file_lines = len(lines)
 
         return True
 
@@ -38,10 +62,48 @@ class Archive(Set):
 
         ### Arguments
         - file: the file name of the archive
+
+        ### Notes
+        - If the file was loaded or saved before and no elements were removed,
+            only the new elements are appended to it.
+        - Otherwise, or if more than half of the lines in the file are duplicates,
+            the file is rewritten atomically.
         """
 
-        with open(file, "w", encoding="utf-8") as archive:
-            for element in sorted(self):
-                archive.write(f"{element}\n")
+        if (
+            self.file == abspath(file)
+            and exists(file)
+            and self.saved.issubset(self)
+            and len(self) >= self.file_lines / 2
+        ):
+            new_elements = sorted(self - self.saved)
+            if new_elements:
+                # The file might not end with a newline, e.g. if it was edited by hand
+                with open(file, "rb") as archive:
+                    missing_newline = False
+                    if archive.seek(0, os.SEEK_END) > 0:
+                        archive.seek(-1, os.SEEK_END)
+                        missing_newline = archive.read(1) != b"\n"
+
+                with open(file, "a", encoding="utf-8") as archive:
+                    if missing_newline:
+                        archive.write("\n")
+
+                    archive.writelines(f"{element}\n" for element in new_elements)
+
+            self.saved.update(new_elements)
+            self.file_lines += len(new_elements)
+
+            return True
+
+        temp_file = f"{file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as archive:
+            archive.writelines(f"{element}\n" for element in sorted(self))
+
+        os.replace(temp_file, file)
+
+        self.file = abspath(file)
+        self.saved = set(self)
+        self.file_lines = len(self)
 
         return True
@@ -11,6 +11,7 @@ import stat
 import platform
 import shlex
 
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
@@ -44,6 +45,16 @@ FFMPEG_FORMATS = {
     "m4a": ["-codec:a", "aac"],
 }
 
+# ffmpeg muxers for the output formats, used when the output file
+# doesn't have the format's extension (e.g. `tmp1a2b3c.part`)
+FFMPEG_MUXERS = {
+    "mp3": "mp3",
+    "flac": "flac",
+    "ogg": "ogg",
+    "opus": "opus",
+    "m4a": "ipod",
+}
+
 DUR_REGEX = re.compile(
     r"Duration: (?P<hour>\d{2}):(?P<min>\d{2}):(?P<sec>\d{2})\.(?P<ms>\d{2})"
 )
@@ -105,6 +116,7 @@ def get_ffmpeg_path() -> Optional[Path]:
     return get_local_ffmpeg()
 
 
+@lru_cache(maxsize=None)
 def get_ffmpeg_version(ffmpeg: str = "ffmpeg") -> Tuple[Optional[float], Optional[int]]:
     """
     Get ffmpeg version.
@@ -118,6 +130,10 @@ def get_ffmpeg_version(ffmpeg: str = "ffmpeg") -> Tuple[Optional[float], Optiona
     ### Errors
     - FFmpegError if ffmpeg is not installed.
     - FFmpegError if ffmpeg version is not found.
+
+    ### Notes
+    - The result is cached per executable, so ffmpeg is only spawned
+        once even if many conversions fail.
     """
 
     # Check if ffmpeg is installed
@@ -302,6 +318,10 @@ def convert(
     if ffmpeg_args:
         arguments.extend(shlex.split(ffmpeg_args))
 
+    # Set the muxer explicitly if ffmpeg can't guess it from the extension
+    if output_file.suffix != f".{output_format}":
+        arguments.extend(["-f", FFMPEG_MUXERS[output_format]])
+
     # Add output file at the end
     arguments.append(str(output_file.resolve()))
 
@@ -376,7 +376,7 @@ def get_song_metadata(path: Path) -> Optional[Dict[str, Any]]:
     for key in TAG_PRESET:
         song_meta[key] = audio_file.get(key)
 
-    if path.suffix == ".mp3":
+    if path.suffix.lower() == ".mp3":
         song_meta["lyrics"] = audio_file.get("USLT::'eng'")
 
     return song_meta
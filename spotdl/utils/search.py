@@ -20,18 +20,19 @@ class QueryError(Exception):
     """
 
 
-def get_search_results(search_term: str) -> List[Song]:
+def get_search_results(search_term: str, threads: int = 4) -> List[Song]:
     """
     Creates a list of Song objects from a search term.
 
     ### Arguments
     - search_term: the search term to use
+    - threads: the number of threads to fetch the songs with
 
     ### Returns
     - a list of Song objects
     """
 
-    return Song.list_from_search_term(search_term)
+    return Song.list_from_search_term(search_term, threads)
 
 
 def parse_query(
@@ -227,7 +227,9 @@ def song_from_url(url: str) -> Song:
 
 
 @router.get("/api/songs/search", response_model=None)
-def query_search(query: str) -> List[Song]:
+def query_search(
+    query: str, state: ApplicationState = Depends(get_current_state)
+) -> List[Song]:
     """
     Parse search term and return list of Song objects.
 
@@ -238,7 +240,7 @@ def query_search(query: str) -> List[Song]:
     - returns a list of Song objects.
     """
 
-    return get_search_results(query)
+    return get_search_results(query, state.settings["threads"])
 
 
 @router.get("/api/albums/search", response_model=None)
@@ -13,3 +13,48 @@ def test_load_archive(tmpdir, monkeypatch):
     assert len(archive2) == len(archive1)
     diff = archive2 ^ archive1
     assert len(diff) == 0
+
+
+def test_save_appends_new_elements(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("archive.txt").write("b\na\n")
+    archive = Archive()
+    assert archive.load("archive.txt") is True
+    archive.update(["d", "c"])
+    assert archive.save("archive.txt") is True
+    assert tmpdir.join("archive.txt").read() == "b\na\nc\nd\n"
+    assert archive.save("archive.txt") is True
+    assert tmpdir.join("archive.txt").read() == "b\na\nc\nd\n"
+
+
+def test_save_appends_after_missing_newline(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("archive.txt").write("b\na")
+    archive = Archive()
+    assert archive.load("archive.txt") is True
+    archive.add("c")
+    assert archive.save("archive.txt") is True
+    assert tmpdir.join("archive.txt").read() == "b\na\nc\n"
+    archive2 = Archive()
+    assert archive2.load("archive.txt") is True
+    assert archive2 == {"a", "b", "c"}
+
+
+def test_save_rewrites_removed_elements(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("archive.txt").write("b\na\nc\n")
+    archive = Archive()
+    assert archive.load("archive.txt") is True
+    archive.discard("c")
+    assert archive.save("archive.txt") is True
+    assert tmpdir.join("archive.txt").read() == "a\nb\n"
+    assert tmpdir.join("archive.txt.tmp").exists() is False
+
+
+def test_save_compacts_duplicates(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("archive.txt").write("a\na\na\na\nb\n")
+    archive = Archive()
+    assert archive.load("archive.txt") is True
+    assert archive.save("archive.txt") is True
+    assert tmpdir.join("archive.txt").read() == "a\nb\n"
@@ -139,3 +139,22 @@ def test_convert(tmpdir, monkeypatch):
         output_format="m4a",
         bitrate="320K",
     ) == (True, None)
+
+
+def test_convert_sets_muxer(tmpdir, fake_process):
+    """
+    Test that convert sets the muxer if the output file has a different extension.
+    """
+
+    fake_process.register_subprocess([fake_process.any()])
+
+    output_file = Path(tmpdir, "test.part")
+
+    assert convert(
+        input_file=Path(tmpdir, "test.webm"),
+        output_file=output_file,
+        output_format="m4a",
+    ) == (True, None)
+
+    arguments = list(fake_process.calls[0])
+    assert arguments[-3:] == ["-f", "ipod", str(output_file.resolve())]